@@ -1,13 +1,16 @@
 """Command line interface tool for the Jac language."""
 
 import ast as ast3
+import functools
 import importlib
 import marshal
 import os
 import pickle
 import shutil
+import sys
 import types
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
 
 import jaclang.compiler.absyntree as ast
 from jaclang import jac_import
@@ -26,38 +29,55 @@ from jaclang.utils.lang_tools import AstTool
 
 Cmd.create_cmd()
 
+# Each format worker has to start up (and re-import the compiler where processes
+# are spawned), so a worker is only added for every this many files.
+_FORMAT_FILES_PER_WORKER = 32
+
+
+def _format_file(filename: str) -> Optional[str]:
+    """Format a .jac file, returning None if it has errors."""
+    code_gen_format = jac_file_to_pass(filename, schedule=format_pass)
+    return None if code_gen_format.errors_had else code_gen_format.ir.gen.jac
+
 
 @cmd_registry.register
 def format(path: str, outfile: str = "", debug: bool = False) -> None:
     """Run the specified .jac file or format all .jac files in a given directory."""
 
-    def format_file(filename: str) -> None:
-        code_gen_format = jac_file_to_pass(filename, schedule=format_pass)
-        if code_gen_format.errors_had:
+    def write_result(filename: str, formatted: Optional[str]) -> None:
+        if formatted is None:
             print(f"Errors occurred while formatting the file {filename}.")
         elif debug:
-            print(code_gen_format.ir.gen.jac)
-        elif outfile:
-            with open(outfile, "w") as f:
-                f.write(code_gen_format.ir.gen.jac)
+            print(formatted)
         else:
-            with open(filename, "w") as f:
-                f.write(code_gen_format.ir.gen.jac)
+            with open(outfile or filename, "w") as f:
+                f.write(formatted)
 
     if path.endswith(".jac"):
         if os.path.exists(path):
-            format_file(path)
+            write_result(path, _format_file(path))
         else:
             print("File does not exist.")
     elif os.path.isdir(path):
-        count = 0
-        for root, _, files in os.walk(path):
-            for file in files:
-                if file.endswith(".jac"):
-                    file_path = os.path.join(root, file)
-                    format_file(file_path)
-                    count += 1
-        print(f"Formatted {count} '.jac' files.")
+        file_paths = [
+            os.path.join(root, file)
+            for root, _, files in os.walk(path)
+            for file in files
+            if file.endswith(".jac")
+        ]
+        # Files are formatted independently, so spread large batches across
+        # processes and format small ones in-process.
+        workers = min(os.cpu_count() or 1, len(file_paths) // _FORMAT_FILES_PER_WORKER)
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for file_path, formatted in zip(
+                    file_paths, pool.map(_format_file, file_paths)
+                ):
+                    write_result(file_path, formatted)
+        else:
+            for file_path in file_paths:
+                write_result(file_path, _format_file(file_path))
+        print(f"Formatted {len(file_paths)} '.jac' files.")
     else:
         print("Not a .jac file or directory.")
 
@@ -179,6 +199,17 @@ def test(
     )
 
 
+@functools.cache
+def _tool_table() -> dict[str, Callable]:
+    """Map AST tool names to methods of a single AstTool instance."""
+    ast_tool = AstTool()
+    return {
+        name: getattr(ast_tool, name)
+        for name in dir(AstTool)
+        if not name.startswith("_") and callable(getattr(AstTool, name))
+    }
+
+
 @cmd_registry.register
 def tool(tool: str, args: Optional[list] = None) -> None:
     """Run the specified AST tool with optional arguments.
@@ -186,12 +217,13 @@ def tool(tool: str, args: Optional[list] = None) -> None:
     :param tool: The name of the AST tool to run.
     :param args: Optional arguments for the AST tool.
     """
-    if hasattr(AstTool, tool):
+    fn = _tool_table().get(tool)
+    if fn is not None:
         try:
             if args and len(args):
-                print(getattr(AstTool(), tool)(args))
+                print(fn(args))
             else:
-                print(getattr(AstTool(), tool)())
+                print(fn())
         except Exception as e:
             print(f"Error while running ast tool {tool}, check args: {e}")
             raise e
@@ -205,13 +237,22 @@ def clean() -> None:
 
     from the current directory recursively.
     """
-    current_dir = os.getcwd()
-    for root, dirs, _files in os.walk(current_dir, topdown=True):
-        for folder_name in dirs[:]:
-            if folder_name == Constants.JAC_GEN_DIR:
-                folder_to_remove = os.path.join(root, folder_name)
-                shutil.rmtree(folder_to_remove)
-                print(f"Removed folder: {folder_to_remove}")
+    targets = frozenset({"__pycache__", Constants.JAC_GEN_DIR})
+    stack = [os.getcwd()]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:  # unreadable folder, skip it as os.walk would
+            continue
+        with entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name in targets:
+                    shutil.rmtree(entry.path)
+                    print(f"Removed folder: {entry.path}")
+                else:
+                    stack.append(entry.path)
     print("Done cleaning.")
 
 
@@ -319,7 +360,7 @@ def start_cli() -> None:
     Returns:
     - None
     """
-    parser = cmd_registry.parser
+    parser = cmd_registry.parser_for(sys.argv[1:])
     args = parser.parse_args()
     command = cmd_registry.get(args.command)
     if command:
@@ -5,7 +5,7 @@ from __future__ import annotations
 import argparse
 import cmd
 import inspect
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 
 class Command:
@@ -13,11 +13,24 @@ class Command:
 
     func: Callable
     sig: inspect.Signature
+    doc: Optional[str]
+    param_types: dict[str, Any]
 
     def __init__(self, func: Callable) -> None:
         """Initialize a Command instance."""
         self.func = func
         self.sig = inspect.signature(func)
+        self.doc = func.__doc__
+        self.param_types = {}
+
+    def param_type(self, name: str) -> Any:  # noqa: ANN401
+        """Resolve the annotation of a parameter to a type once."""
+        if name not in self.param_types:
+            annotation = self.sig.parameters[name].annotation
+            self.param_types[name] = (
+                eval(annotation) if isinstance(annotation, str) else annotation
+            )
+        return self.param_types[name]
 
     def call(self, *args: list, **kwargs: dict) -> str:
         """Call the associated function with the specified arguments and keyword arguments."""
@@ -29,21 +42,42 @@ class CommandRegistry:
 
     registry: dict[str, Command]
     sub_parsers: argparse._SubParsersAction
-    parser: argparse.ArgumentParser
+    _parser: argparse.ArgumentParser
 
     def __init__(self) -> None:
         """Initialize a CommandRegistry instance."""
         self.registry = {}
-        self.parser = argparse.ArgumentParser(prog="CLI")
-        self.sub_parsers = self.parser.add_subparsers(title="commands", dest="command")
+        self._parser = argparse.ArgumentParser(prog="CLI")
+        self.sub_parsers = self._parser.add_subparsers(
+            title="commands", dest="command"
+        )
+
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """Get the argument parser with every command's subparser built."""
+        for name in self.registry:
+            self.build_sub_parser(name)
+        return self._parser
+
+    def parser_for(self, argv: list[str]) -> argparse.ArgumentParser:
+        """Get an argument parser that only builds the subparser argv selects."""
+        if argv and argv[0] in self.registry:
+            self.build_sub_parser(argv[0])
+            return self._parser
+        return self.parser
 
     def register(self, func: Callable) -> Callable:
         """Register a command in the registry."""
-        name = func.__name__
-        cmd = Command(func)
-        self.registry[name] = cmd
+        self.registry[func.__name__] = Command(func)
+        return func
+
+    def build_sub_parser(self, name: str) -> argparse.ArgumentParser:
+        """Build the subparser for a registered command on first use."""
+        if name in self.sub_parsers.choices:
+            return self.sub_parsers.choices[name]
+        cmd = self.registry[name]
         cmd_parser: argparse.ArgumentParser = self.sub_parsers.add_parser(
-            name, description=func.__doc__
+            name, description=cmd.doc
         )
         first = True
         for param_name, param in cmd.sig.parameters.items():
@@ -54,11 +88,7 @@ class CommandRegistry:
                 first = False
                 cmd_parser.add_argument(
                     f"{param_name}",
-                    type=(
-                        eval(param.annotation)
-                        if isinstance(param.annotation, str)
-                        else param.annotation
-                    ),
+                    type=cmd.param_type(param_name),
                     help=arg_msg,
                     nargs="?",
                 )
@@ -67,11 +97,7 @@ class CommandRegistry:
                     first = False
                     cmd_parser.add_argument(
                         f"{param_name}",
-                        type=(
-                            eval(param.annotation)
-                            if isinstance(param.annotation, str)
-                            else param.annotation
-                        ),
+                        type=cmd.param_type(param_name),
                         help=arg_msg,
                     )
                 else:
@@ -79,11 +105,7 @@ class CommandRegistry:
                         f"-{param_name[:1]}",
                         f"--{param_name}",
                         required=True,
-                        type=(
-                            eval(param.annotation)
-                            if isinstance(param.annotation, str)
-                            else param.annotation
-                        ),
+                        type=cmd.param_type(param_name),
                         help=arg_msg,
                     )
             elif first:
@@ -92,7 +114,7 @@ class CommandRegistry:
                 cmd_parser.add_argument(
                     f"{param_name}",
                     default=param.default,
-                    type=eval(param.annotation),
+                    type=cmd.param_type(param_name),
                     help=arg_msg,
                 )
             else:
@@ -118,13 +140,9 @@ class CommandRegistry:
                         f"--{param_name}",
                         default=param.default,
                         help=arg_msg,
-                        type=(
-                            eval(param.annotation)
-                            if isinstance(param.annotation, str)
-                            else param.annotation
-                        ),
+                        type=cmd.param_type(param_name),
                     )
-        return func
+        return cmd_parser
 
     def get(self, name: str) -> Optional[Command]:
         """Get the Command instance for a given command name."""
@@ -134,7 +152,7 @@ class CommandRegistry:
         """Get all registered commands along with their details."""
         all_commands = {}
         for name, comd in self.registry.items():
-            doc = comd.func.__doc__ or "No help available."
+            doc = comd.doc or "No help available."
             args = comd.sig.parameters
             all_commands[name] = (doc, args)
         return all_commands
@@ -187,7 +205,7 @@ class CommandShell(cmd.Cmd):
             self.stdout.write(
                 f"\tArguments: {arg_details}\n" if arg_details else "\tNo arguments\n"
             )
-            command_parser = self.cmd_reg.sub_parsers.choices[name]
+            command_parser = self.cmd_reg.build_sub_parser(name)
             self.stdout.write(f"\tUsage: {command_parser.format_usage()[7:]}\n")
 
         if arg == "all":
@@ -198,7 +216,7 @@ class CommandShell(cmd.Cmd):
         elif arg:
             command = self.cmd_reg.get(arg)
             if command:
-                doc = command.func.__doc__ or "No help available."
+                doc = command.doc or "No help available."
                 args = command.sig.parameters
                 get_info(arg, doc, args)
             else:
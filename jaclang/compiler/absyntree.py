@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import ast as ast3
+import sys
 from types import EllipsisType
 from typing import Any, Callable, Generic, Optional, Sequence, Type, TypeVar
 
@@ -32,9 +33,27 @@ class AstNode:
         self._sub_node_tab: dict[type, list[AstNode]] = {}
         self._typ: type = type(None)
         self.gen: CodeGenTarget = CodeGenTarget()
-        self.meta: dict[str, str] = {}
+        self._meta: Optional[dict[str, str]] = None
         self.loc: CodeLocInfo = CodeLocInfo(*self.resolve_tok_range())
 
+    @property
+    def meta(self) -> dict[str, str]:
+        """Get free-form node metadata, created on first use."""
+        if self._meta is None:
+            self._meta = {}
+        return self._meta
+
+    @meta.setter
+    def meta(self, value: dict[str, str]) -> None:
+        """Set free-form node metadata."""
+        self._meta = value
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore a pickled node, including ones pickled with a meta dict."""
+        if "meta" in state:
+            state["_meta"] = state.pop("meta")
+        self.__dict__.update(state)
+
     def add_kids_left(
         self, nodes: Sequence[AstNode], pos_update: bool = True
     ) -> AstNode:
@@ -1287,8 +1306,7 @@ class ArchRefChain(AstNode):
             for a in self.archs:
                 res = res and a.normalize(deep)
         new_kid: list[AstNode] = []
-        for a in self.archs:
-            new_kid.append(a)
+        new_kid.extend(self.archs)
         self.set_kids(nodes=new_kid)
         return res
 
@@ -2499,8 +2517,7 @@ class MultiString(AtomExpr):
             for string in self.strings:
                 res = res and string.normalize(deep)
         new_kid: list[AstNode] = []
-        for string in self.strings:
-            new_kid.append(string)
+        new_kid.extend(self.strings)
         self.set_kids(nodes=new_kid)
         return res
 
@@ -2821,8 +2838,7 @@ class ListCompr(AtomExpr):
             self.gen_token(Tok.LSQUARE),
             self.out_expr,
         ]
-        for comp in self.compr:
-            new_kid.append(comp)
+        new_kid.extend(self.compr)
         new_kid.append(self.gen_token(Tok.RSQUARE))
         self.set_kids(nodes=new_kid)
         return res
@@ -2842,8 +2858,7 @@ class GenCompr(ListCompr):
             self.gen_token(Tok.LPAREN),
             self.out_expr,
         ]
-        for comp in self.compr:
-            new_kid.append(comp)
+        new_kid.extend(self.compr)
         new_kid.append(self.gen_token(Tok.RPAREN))
         self.set_kids(nodes=new_kid)
         return res
@@ -2863,8 +2878,7 @@ class SetCompr(ListCompr):
             self.gen_token(Tok.LBRACE),
             self.out_expr,
         ]
-        for comp in self.compr:
-            new_kid.append(comp)
+        new_kid.extend(self.compr)
         new_kid.append(self.gen_token(Tok.RBRACE))
         self.set_kids(nodes=new_kid)
         return res
@@ -2900,8 +2914,7 @@ class DictCompr(AtomExpr):
             self.gen_token(Tok.LBRACE),
             self.kv_pair,
         ]
-        for comp in self.compr:
-            new_kid.append(comp)
+        new_kid.extend(self.compr)
         new_kid.append(self.gen_token(Tok.RBRACE))
         self.set_kids(nodes=new_kid)
         return res
@@ -3438,8 +3451,7 @@ class MatchStmt(CodeBlockStmt):
             self.target,
         ]
         new_kid.append(self.gen_token(Tok.LBRACE))
-        for case in self.cases:
-            new_kid.append(case)
+        new_kid.extend(self.cases)
         new_kid.append(self.gen_token(Tok.RBRACE))
 
         self.set_kids(nodes=new_kid)
@@ -4082,7 +4094,7 @@ class JacSource(EmptyToken):
         """Initialize source string."""
         super().__init__()
         self.value = source
-        self.file_path = mod_path
+        self.file_path = sys.intern(mod_path)
         self.comments: list[CommentToken] = []
 
     @property
@@ -4098,4 +4110,4 @@ class PythonModuleAst(EmptyToken):
         """Initialize source string."""
         super().__init__()
         self.ast = ast
-        self.file_path = mod_path
+        self.file_path = sys.intern(mod_path)
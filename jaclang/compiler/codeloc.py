@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import ast as ast3
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 from jaclang.vendor.mypy.nodes import Node as MypyNode
 
@@ -12,7 +12,18 @@ if TYPE_CHECKING:
     from jaclang.compiler.absyntree import Token
 
 
-@dataclass
+def _restore_slots(obj: object, state: Any) -> None:  # noqa: ANN401
+    """Restore pickled state onto a slotted object.
+
+    Objects pickled before these classes had slots carry a plain dict.
+    """
+    if isinstance(state, tuple):
+        state = {**(state[0] or {}), **state[1]}
+    for name, value in state.items():
+        setattr(obj, name, value)
+
+
+@dataclass(slots=True)
 class CodeGenTarget:
     """Code generation target."""
 
@@ -29,10 +40,16 @@ class CodeGenTarget:
         self.py_ast = []
         self.mypy_ast = []
 
+    def __setstate__(self, state: Any) -> None:  # noqa: ANN401
+        """Restore pickled state."""
+        _restore_slots(self, state)
+
 
 class CodeLocInfo:
     """Code location info."""
 
+    __slots__ = ("first_tok", "last_tok")
+
     def __init__(
         self,
         first_tok: Token,
@@ -105,6 +122,10 @@ class CodeLocInfo:
         """Update last token."""
         self.last_tok = last_tok
 
+    def __setstate__(self, state: Any) -> None:  # noqa: ANN401
+        """Restore pickled state."""
+        _restore_slots(self, state)
+
     def __str__(self) -> str:
         """Stringify."""
         return f"{self.first_tok.line_no}:{self.first_tok.c_start} - {self.last_tok.line_no}:{self.last_tok.c_end}"
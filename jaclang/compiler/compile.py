@@ -1,6 +1,6 @@
 """Transpilation functions."""
 
-from typing import Optional, Type
+from typing import Optional, Sequence, Type
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.parser import JacParser
@@ -26,7 +26,7 @@ def compile_jac(file_path: str, cache_result: bool = False) -> Pass:
 def jac_file_to_pass(
     file_path: str,
     target: Optional[Type[Pass]] = None,
-    schedule: list[Type[Pass]] = pass_schedule,
+    schedule: Sequence[Type[Pass]] = pass_schedule,
 ) -> Pass:
     """Convert a Jac file to an AST."""
     with open(file_path) as file:
@@ -42,7 +42,7 @@ def jac_str_to_pass(
     jac_str: str,
     file_path: str,
     target: Optional[Type[Pass]] = None,
-    schedule: list[Type[Pass]] = pass_schedule,
+    schedule: Sequence[Type[Pass]] = pass_schedule,
 ) -> Pass:
     """Convert a Jac file to an AST."""
     if not target:
@@ -60,7 +60,7 @@ def jac_str_to_pass(
 def jac_pass_to_pass(
     in_pass: Pass,
     target: Optional[Type[Pass]] = None,
-    schedule: list[Type[Pass]] = pass_schedule,
+    schedule: Sequence[Type[Pass]] = pass_schedule,
 ) -> Pass:
     """Convert a Jac file to an AST."""
     if not target:
@@ -76,7 +76,7 @@ def jac_pass_to_pass(
 
 def jac_file_formatter(
     file_path: str,
-    schedule: list[Type[Pass]] = format_pass,
+    schedule: Sequence[Type[Pass]] = format_pass,
 ) -> JacFormatPass:
     """Convert a Jac file to an AST."""
     target = JacFormatPass
@@ -1,6 +1,8 @@
 """Abstract class for IR Passes for Jac."""
 
-from typing import Optional, Type, TypeVar
+import functools
+import sys
+from typing import Callable, Optional, Type, TypeVar
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes.transform import Transform
@@ -9,6 +11,38 @@ from jaclang.utils.helpers import pascal_to_snake
 T = TypeVar("T", bound=ast.AstNode)
 
 
+@functools.cache
+def ast_node_types_by_snake_name() -> dict[str, type]:
+    """Map snake case names to every AstNode subclass."""
+    ret: dict[str, type] = {}
+    stack: list[type] = [ast.AstNode]
+    while stack:
+        cls = stack.pop()
+        ret[sys.intern(pascal_to_snake(cls.__name__))] = cls
+        stack.extend(cls.__subclasses__())
+    return ret
+
+
+@functools.cache
+def _handler_names(
+    pass_cls: type,
+) -> tuple[tuple[tuple[type, str], ...], tuple[tuple[type, str], ...]]:
+    """Get the (node type, handler name) pairs for a pass class's handlers."""
+    node_types = ast_node_types_by_snake_name()
+    enter: list[tuple[type, str]] = []
+    exit: list[tuple[type, str]] = []
+    for name in dir(pass_cls):
+        if name.startswith("enter_"):
+            table, typ = enter, node_types.get(name[6:])
+        elif name.startswith("exit_"):
+            table, typ = exit, node_types.get(name[5:])
+        else:
+            continue
+        if typ is not None:
+            table.append((typ, name))
+    return tuple(enter), tuple(exit)
+
+
 class Pass(Transform[T]):
     """Abstract class for IR passes."""
 
@@ -17,8 +51,27 @@ class Pass(Transform[T]):
         self.term_signal = False
         self.prune_signal = False
         self.ir: ast.AstNode = input_ir
+        self._enter_dispatch: dict[type, Callable[[ast.AstNode], None]] = {}
+        self._exit_dispatch: dict[type, Callable[[ast.AstNode], None]] = {}
+        self._handled: Optional[frozenset[type]] = None
+        self.build_dispatch()
         Transform.__init__(self, input_ir, prior)
 
+    def build_dispatch(self) -> None:
+        """Bind this pass's enter_*/exit_* handlers to the node types they handle."""
+        enter, exit = _handler_names(type(self))
+        self._enter_dispatch = {typ: getattr(self, name) for typ, name in enter}
+        self._exit_dispatch = {typ: getattr(self, name) for typ, name in exit}
+        # Passes that only react to their typed handlers can skip subtrees the
+        # sub node table shows hold none of those node types.
+        if (
+            type(self).enter_node is Pass.enter_node
+            and type(self).exit_node is Pass.exit_node
+        ):
+            self._handled = frozenset(self._enter_dispatch) | frozenset(
+                self._exit_dispatch
+            )
+
     def before_pass(self) -> None:
         """Run once before pass."""
         pass
@@ -29,13 +82,15 @@ class Pass(Transform[T]):
 
     def enter_node(self, node: ast.AstNode) -> None:
         """Run on entering node."""
-        if hasattr(self, f"enter_{pascal_to_snake(type(node).__name__)}"):
-            getattr(self, f"enter_{pascal_to_snake(type(node).__name__)}")(node)
+        fn = self._enter_dispatch.get(type(node))
+        if fn is not None:
+            fn(node)
 
     def exit_node(self, node: ast.AstNode) -> None:
         """Run on exiting node."""
-        if hasattr(self, f"exit_{pascal_to_snake(type(node).__name__)}"):
-            getattr(self, f"exit_{pascal_to_snake(type(node).__name__)}")(node)
+        fn = self._exit_dispatch.get(type(node))
+        if fn is not None:
+            fn(node)
 
     def terminate(self) -> None:
         """Terminate traversal."""
@@ -56,9 +111,7 @@ class Pass(Transform[T]):
             return result
         elif len(node._sub_node_tab):
             if typ in node._sub_node_tab:
-                for i in node._sub_node_tab[typ]:
-                    if isinstance(i, typ):
-                        result.append(i)
+                result.extend(i for i in node._sub_node_tab[typ] if isinstance(i, typ))
         elif len(node.kid):
             if not brute_force:
                 raise ValueError(f"Node has no sub_node_tab. {node}")
@@ -112,21 +165,43 @@ class Pass(Transform[T]):
         return self.ir
 
     def traverse(self, node: ast.AstNode) -> ast.AstNode:
-        """Traverse tree."""
-        if self.term_signal:
-            return node
-        self.cur_node = node
-        self.enter_node(node)
-        if not self.prune_signal:
-            for i in node.kid:
-                if i:
-                    self.traverse(i)
-        else:
-            self.prune_signal = False
-        self.cur_node = node
-        self.exit_node(node)
+        """Traverse tree with an explicit stack of (node, exiting) entries."""
+        stack: list[tuple[ast.AstNode, bool]] = [(node, False)]
+        push, pop = stack.append, stack.pop
+        enter_node, exit_node = self.enter_node, self.exit_node
+        while stack:
+            cur, exiting = pop()
+            if exiting:
+                self.cur_node = cur
+                exit_node(cur)
+                continue
+            if self.term_signal:
+                continue
+            self.cur_node = cur
+            enter_node(cur)
+            if not cur.kid:  # leaves (mostly tokens) exit without a stack trip
+                self.prune_signal = False
+                self.cur_node = cur
+                exit_node(cur)
+                continue
+            push((cur, True))
+            if self.prune_signal:
+                self.prune_signal = False
+            elif self._handled is None:
+                stack.extend((i, False) for i in reversed(cur.kid))
+            else:
+                stack.extend((i, False) for i in reversed(cur.kid) if self.reaches(i))
         return node
 
+    def reaches(self, node: ast.AstNode) -> bool:
+        """Check if a subtree may contain a node this pass handles."""
+        handled = self._handled
+        if handled is None or type(node) in handled:
+            return True
+        if not node._sub_node_tab:
+            return bool(node.kid)  # no table built, so it has to be walked
+        return not handled.isdisjoint(node._sub_node_tab)
+
     def update_code_loc(self, node: Optional[ast.AstNode] = None) -> None:
         """Update code location."""
         if node is None:
@@ -3,16 +3,16 @@
 This pass creates links in the ast between Decls of Architypes and Abilities
 that are separate from their implementations (Defs). This pass creates a link
 in the ast between the Decls and Defs of Architypes and Abilities through the
-body field.
+body field. The sub node table is rebuilt on the same traversal so newly linked
+Defs are tabulated under their Decls.
 """
 
 import jaclang.compiler.absyntree as ast
-from jaclang.compiler.passes import Pass
 from jaclang.compiler.passes.main import SubNodeTabPass
 from jaclang.compiler.symtable import Symbol, SymbolTable, SymbolType
 
 
-class DeclDefMatchPass(Pass):
+class DeclDefMatchPass(SubNodeTabPass):
     """Decls and Def matching pass."""
 
     def enter_module(self, node: ast.Module) -> None:
@@ -24,10 +24,6 @@ class DeclDefMatchPass(Pass):
         else:
             self.connect_def_impl(node.sym_tab)
 
-    def after_pass(self) -> None:
-        """Rebuild sub node table."""
-        self.ir = SubNodeTabPass(input_ir=self.ir, prior=self).ir
-
     def defn_lookup(self, lookup: Symbol) -> ast.AstImplNeedingNode | None:
         """Lookup a definition in a symbol table."""
         for defn in range(len(lookup.defn)):
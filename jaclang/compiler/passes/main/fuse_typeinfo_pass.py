@@ -33,6 +33,15 @@ class FuseTypeInfoPass(Pass):
         if settings.fuse_type_info_debug:
             print("FuseTypeInfo::", *argv)
 
+    def __debug_print_node(self, node: ast.AstNode, msg: str) -> None:
+        if settings.fuse_type_info_debug:
+            jac_node_str = f'jac node "{node.loc}::{node.__class__.__name__}'
+            if hasattr(node, "value"):
+                jac_node_str += f'::{node.value}"'
+            else:
+                jac_node_str += '"'
+            self.__debug_print(jac_node_str, msg)
+
     def __call_type_handler(
         self, node: ast.AstSymbolNode, mypy_type: MypyTypes.ProperType
     ) -> None:
@@ -66,12 +75,6 @@ class FuseTypeInfoPass(Pass):
                 print(f"Warning {node.__class__.__name__} is not an AstSymbolNode")
 
             try:
-                jac_node_str = f'jac node "{node.loc}::{node.__class__.__name__}'
-                if hasattr(node, "value"):
-                    jac_node_str += f'::{node.value}"'
-                else:
-                    jac_node_str += '"'
-
                 # Jac node has only one mypy node linked to it
                 if len(node.gen.mypy_ast) == 1:
                     func(self, node)
@@ -90,20 +93,20 @@ class FuseTypeInfoPass(Pass):
 
                     # Check the number of unique mypy nodes linked
                     if len(temp) > 1:
-                        self.__debug_print(
-                            jac_node_str, "has multiple mypy nodes associated to it"
+                        self.__debug_print_node(
+                            node, "has multiple mypy nodes associated to it"
                         )
                     else:
-                        self.__debug_print(
-                            jac_node_str, "has duplicate mypy nodes associated to it"
+                        self.__debug_print_node(
+                            node, "has duplicate mypy nodes associated to it"
                         )
                         func(self, node)
                         self.__set_sym_table_link(node)
 
                 # Jac node doesn't have mypy nodes linked to it
                 else:
-                    self.__debug_print(
-                        jac_node_str, "doesn't have mypy node associated to it"
+                    self.__debug_print_node(
+                        node, "doesn't have mypy node associated to it"
                     )
 
             except AttributeError as e:
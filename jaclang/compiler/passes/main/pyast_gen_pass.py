@@ -1,7 +1,7 @@
 """Jac Blue pass for Jaseci Ast.
 
-At the end of this pass a meta['py_code'] is present with pure python code
-in each node. Module nodes contain the entire module code.
+At the end of this pass a gen.py_ast is present with python ast nodes
+in each node. Module nodes contain the entire module ast.
 """
 
 import ast as ast3
@@ -11,6 +11,7 @@ import os
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.constant import Constants as Con
 from jaclang.compiler.passes import Pass
+from jaclang.utils.helpers import jbc_header
 
 
 class PyOutPass(Pass):
@@ -38,13 +39,14 @@ class PyOutPass(Pass):
         mods = [node] + self.get_all_sub_nodes(node, ast.Module)
         for mod in mods:
             mod_path, out_path_py, out_path_pyc = self.get_output_targets(mod)
-            if os.path.exists(out_path_pyc) and os.path.getmtime(
-                out_path_pyc
-            ) > os.path.getmtime(mod_path):
-                continue
+            header = jbc_header(mod_path)
+            if os.path.exists(out_path_pyc):
+                with open(out_path_pyc, "rb") as f:
+                    if f.read(len(header)) == header:
+                        continue
             try:
                 self.gen_python(mod, out_path=out_path_py)
-                self.dump_bytecode(mod, mod_path=mod_path, out_path=out_path_pyc)
+                self.dump_bytecode(mod, header=header, out_path=out_path_pyc)
             except Exception as e:
                 self.warning(f"Error in generating Python code: {e}", node)
         self.terminate()
@@ -54,11 +56,11 @@ class PyOutPass(Pass):
         with open(out_path, "w") as f:
             f.write(node.gen.py)
 
-    def dump_bytecode(self, node: ast.Module, mod_path: str, out_path: str) -> None:
+    def dump_bytecode(self, node: ast.Module, header: bytes, out_path: str) -> None:
         """Generate Python."""
         if node.gen.py_bytecode:
             with open(out_path, "wb") as f:
-                f.write(node.gen.py_bytecode)
+                f.write(header + node.gen.py_bytecode)
         else:
             self.error(
                 f"Soemthing went wrong with {node.loc.mod_path} compilation.", node
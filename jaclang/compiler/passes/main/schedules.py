@@ -5,6 +5,9 @@ These are various pass schedules for the Jac compiler and static analysis.
 
 from __future__ import annotations
 
+from typing import Type
+
+from jaclang.compiler.passes.ir_pass import Pass
 
 from .sub_node_tab_pass import SubNodeTabPass  # noqa: I100
 from .import_pass import JacImportPass, PyImportPass  # noqa: I100
@@ -19,7 +22,7 @@ from .fuse_typeinfo_pass import FuseTypeInfoPass  # noqa: I100
 from .registry_pass import RegistryPass  # noqa: I100
 from .access_modifier_pass import AccessCheckPass  # noqa: I100
 
-py_code_gen = [
+py_code_gen: tuple[Type[Pass], ...] = (
     SubNodeTabPass,
     JacImportPass,
     PyImportPass,
@@ -29,7 +32,12 @@ py_code_gen = [
     RegistryPass,
     PyastGenPass,
     PyBytecodeGenPass,
-]
+)
 
-py_code_gen_typed = [*py_code_gen, JacTypeCheckPass, FuseTypeInfoPass, AccessCheckPass]
-py_compiler = [*py_code_gen, PyOutPass]
+py_code_gen_typed: tuple[Type[Pass], ...] = (
+    *py_code_gen,
+    JacTypeCheckPass,
+    FuseTypeInfoPass,
+    AccessCheckPass,
+)
+py_compiler: tuple[Type[Pass], ...] = (*py_code_gen, PyOutPass)
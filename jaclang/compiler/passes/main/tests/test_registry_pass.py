@@ -37,3 +37,27 @@ class RegistryPassTests(TestCase):
             )
         )
         self.assertIn("109", str(state.ir.to_dict()))
+
+    def test_registry_impl_entries(self) -> None:
+        """Test impls are registered under both their module and their decl."""
+        state = jac_file_to_pass(
+            self.fixture_abs_path("defs_and_uses.jac"), RegistryPass
+        )
+        registry = {
+            str(scope): [sem.name for sem in sems]
+            for scope, sems in state.ir.registry.registry.items()
+        }
+        self.assertEqual(
+            registry["defs_and_uses(Module)"],
+            [
+                "output",
+                "output",
+                "y",
+                "output",
+                "MyPrinter",
+                "y",
+                "output",
+                "output",
+                "YourPrinter",
+            ],
+        )
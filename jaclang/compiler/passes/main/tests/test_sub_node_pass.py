@@ -1,6 +1,8 @@
 """Test sub node pass module."""
 
+import jaclang.compiler.absyntree as ast
 from jaclang.compiler.compile import jac_file_to_pass
+from jaclang.compiler.passes import Pass
 from jaclang.compiler.passes.main import SubNodeTabPass
 from jaclang.utils.test import TestCase
 
@@ -25,3 +27,30 @@ class SubNodePassTests(TestCase):
                 for n in v:
                     self.assertIn(n, code_gen.get_all_sub_nodes(i, k, brute_force=True))
         self.assertFalse(code_gen.errors_had)
+
+    def test_pruned_traversal_reaches_handled_nodes(self) -> None:
+        """Test passes skipping unhandled subtrees still see every handled node."""
+        code_gen = jac_file_to_pass(
+            file_path=self.fixture_abs_path(
+                "../../../../../../examples/manual_code/circle.jac"
+            ),
+            target=SubNodeTabPass,
+        )
+
+        class AbilityCounter(Pass):
+            """Pass with a single typed handler."""
+
+            def before_pass(self) -> None:
+                """Initialize pass."""
+                self.seen: list[ast.Ability] = []
+
+            def enter_ability(self, node: ast.Ability) -> None:
+                """Record ability."""
+                self.seen.append(node)
+
+        counter = AbilityCounter(code_gen.ir, prior=None)
+        self.assertIsNotNone(counter._handled)
+        self.assertEqual(
+            counter.seen, code_gen.get_all_sub_nodes(code_gen.ir, ast.Ability)
+        )
+        self.assertTrue(len(counter.seen))
@@ -2,8 +2,10 @@
 
 from typing import List
 
+import jaclang.compiler.absyntree as ast
 from jaclang.compiler.compile import jac_file_to_pass
 from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+from jaclang.compiler.passes.utils import mypy_ast_build as myab
 from jaclang.utils.test import TestCase
 
 
@@ -47,3 +49,56 @@ class MypyTypeCheckPassTests(TestCase):
             'Argument 2 to "is_pressed" of "Button" has incompatible type "int"; expected "str"',
         ]:
             self.assertIn(i, errs + files)
+
+    def test_typeshed_trees_reused(self) -> None:
+        """Test typeshed trees are reused across type checking runs."""
+        game = self.fixture_abs_path("game1.jac")
+        jac_file_to_pass(file_path=game, schedule=py_code_gen_typed)
+        jac_file_to_pass(file_path=game, schedule=py_code_gen_typed)
+        builtins_tree = myab.fresh_tree_cache["builtins"][1]
+        type_checked = jac_file_to_pass(file_path=game, schedule=py_code_gen_typed)
+        self.assertIs(myab.fresh_tree_cache["builtins"][1], builtins_tree)
+        self.assertEqual(len(type_checked.warnings_had), 1)
+        self.assertTrue(
+            all(
+                mod.path.startswith(myab.TYPESHED_DIR)
+                for _, mod in myab.fresh_tree_cache.values()
+            )
+        )
+
+    def test_typeshed_trees_invalidated(self) -> None:
+        """Test stale or cleared typeshed trees are loaded afresh."""
+        game = self.fixture_abs_path("game1.jac")
+        jac_file_to_pass(file_path=game, schedule=py_code_gen_typed)
+        jac_file_to_pass(file_path=game, schedule=py_code_gen_typed)
+        key, builtins_tree = myab.fresh_tree_cache["builtins"]
+        stale_key = (key[0], key[1] - 1, key[2])
+        myab.fresh_tree_cache["builtins"] = (stale_key, builtins_tree)
+        type_checked = jac_file_to_pass(file_path=game, schedule=py_code_gen_typed)
+        self.assertIsNot(myab.fresh_tree_cache["builtins"][1], builtins_tree)
+        self.assertEqual(myab.fresh_tree_cache["builtins"][0], key)
+        self.assertEqual(len(type_checked.warnings_had), 1)
+        myab.clear_fresh_tree_cache()
+        self.assertEqual(myab.fresh_tree_cache, {})
+        type_checked = jac_file_to_pass(file_path=game, schedule=py_code_gen_typed)
+        self.assertIn("builtins", myab.fresh_tree_cache)
+        self.assertEqual(len(type_checked.warnings_had), 1)
+
+    def test_impl_names_typed(self) -> None:
+        """Test names in impl targets carry type info under the typed schedule."""
+        type_checked = jac_file_to_pass(
+            file_path=self.fixture_abs_path("defs_and_uses.jac"),
+            schedule=py_code_gen_typed,
+        )
+        typs = {
+            (i.value, i.sym_info.typ)
+            for impl in type_checked.ir.get_all_sub_nodes(ast.AbilityDef)
+            for i in impl.target.get_all_sub_nodes(ast.Name)
+        }
+        self.assertEqual(
+            typs,
+            {
+                ("my_print", "builtins.str"),
+                ("MyPrinter", "defs_and_uses.MyPrinter"),
+            },
+        )
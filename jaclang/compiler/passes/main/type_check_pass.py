@@ -83,7 +83,7 @@ class JacTypeCheckPass(Pass):
 
             st = myab.State(
                 id=module.name,
-                path="File:" + module.loc.mod_path,
+                path=sys.intern("File:" + module.loc.mod_path),
                 source="",
                 manager=manager,
                 root_source=False,
@@ -20,51 +20,42 @@ class JacFormatPass(Pass):
         self.comments: list[ast.CommentToken] = []
         self.indent_size = 4
         self.indent_level = 0
+        self.indent_cache: list[str] = ["", " " * self.indent_size]
         self.MAX_LINE_LENGTH = 44
-
-    def enter_node(self, node: ast.AstNode) -> None:
-        """Enter node."""
-        node.gen.jac = ""
-        super().enter_node(node)
+        # Clear output from any earlier run in one sweep, rather than per node
+        # from enter_node, so the traversal keeps its plain dispatch.
+        stack: list[ast.AstNode] = [self.ir]
+        while stack:
+            cur = stack.pop()
+            cur.gen.jac = ""
+            stack.extend(cur.kid)
 
     def indent_str(self) -> str:
         """Return string for indent."""
-        return " " * self.indent_size * self.indent_level
+        if self.indent_level <= 0:
+            return ""
+        while len(self.indent_cache) <= self.indent_level:
+            self.indent_cache.append(" " * self.indent_size * len(self.indent_cache))
+        return self.indent_cache[self.indent_level]
 
     def emit(self, node: ast.AstNode, s: str, strip_mode: bool = True) -> None:
         """Emit code to node."""
-        node.gen.jac += self.indent_str() + s.replace("\n", "\n" + self.indent_str())
-        if "\n" in node.gen.jac:
-            if strip_mode:
-                node.gen.jac = node.gen.jac.rstrip(" ")
-            else:
-                node.gen.jac = node.gen.jac
+        indent = self.indent_str()
+        out = indent + s.replace("\n", "\n" + indent) if indent else s
+        if strip_mode and ("\n" in out or "\n" in node.gen.jac):
+            node.gen.jac = (node.gen.jac + out).rstrip(" ")
+        else:
+            node.gen.jac += out
 
     def emit_ln(self, node: ast.AstNode, s: str) -> None:
         """Emit code to node."""
         self.emit(node, s.strip().strip("\n"))
-        self.emit(node, "\n")
-
-    def comma_sep_node_list(self, node: ast.SubNodeList) -> str:
-        """Render comma separated node list."""
-        node.gen.jac = ", ".join([i.gen.jac for i in node.items])
-        return node.gen.jac
-
-    def dot_sep_node_list(self, node: ast.SubNodeList) -> str:
-        """Render dot separated node list."""
-        node.gen.jac = ".".join([i.gen.jac for i in node.items])
-        return node.gen.jac
-
-    def nl_sep_node_list(self, node: ast.SubNodeList) -> str:
-        """Render newline separated node list."""
-        node.gen.jac = ""
-        for i in node.items:
-            node.gen.jac += f"{i.gen.jac}\n"
-        return node.gen.jac
+        # Same as emit(node, "\n"), whose trailing indent would be stripped.
+        node.gen.jac += self.indent_str() + "\n"
 
     def sep_node_list(self, node: ast.SubNodeList, delim: str = " ") -> str:
-        """Render newline separated node list."""
-        node.gen.jac = f"{delim}".join([i.gen.jac for i in node.items])
+        """Render delimiter separated node list."""
+        node.gen.jac = delim.join([i.gen.jac for i in node.items])
         return node.gen.jac
 
     def enter_module(self, node: ast.Module) -> None:
@@ -87,49 +78,47 @@ class JacFormatPass(Pass):
         body: Sequence[ElementStmt],
         is_imported: bool,
         """
+        emit, emit_ln = self.emit, self.emit_ln
         prev_token = None
         for i in node.kid:
             if isinstance(i, ast.String):
-                self.emit_ln(node, f" {i.gen.jac}")
-                self.emit_ln(node, "")
+                emit_ln(node, f" {i.gen.jac}")
+                emit_ln(node, "")
             elif isinstance(i, ast.CommentToken):
                 if i.is_inline:
-                    self.emit(node, f" {i.gen.jac}")
+                    emit(node, f" {i.gen.jac}")
                 else:
                     if prev_token is not None:
-                        self.emit_ln(node, "")
-                    self.emit_ln(node, i.gen.jac)
+                        emit_ln(node, "")
+                    emit_ln(node, i.gen.jac)
             elif isinstance(i, ast.Token):
-                self.emit(node, i.value.strip("") + " ")
+                emit(node, i.value.strip("") + " ")
             elif isinstance(i, ast.SubTag):
                 for j in i.kid:
-                    self.emit(node, j.gen.jac)
+                    emit(node, j.gen.jac)
             prev_token = i
         last_element = None
         for counter, i in enumerate(node.body):
             counter += 1
             if isinstance(i, ast.Import):
-                self.emit_ln(node, i.gen.jac)
+                emit_ln(node, i.gen.jac)
             else:
                 if isinstance(last_element, ast.Import):
-                    self.emit_ln(node, "")
-                self.emit_ln(node, i.gen.jac)
-                if not node.gen.jac.endswith("\n"):
-                    self.emit_ln(node, "")
-                if counter <= len(node.body) - 1:
-                    if (
-                        isinstance(i, ast.Ability)
-                        and isinstance(node.body[counter], ast.Ability)
-                        and i.gen.jac.endswith(";")
-                        or (
-                            isinstance(i, ast.Architype)
-                            and len(node.body[counter].kid[-1].kid) == 2
-                            and len(node.body[counter - 1].kid[-1].kid) == 2
-                        )
-                    ):
-                        self.emit(node, "")
-                    else:
-                        self.emit_ln(node, "")
+                    emit_ln(node, "")
+                # emit_ln already ends the element with a newline; only the
+                # blank line between elements is left to decide.
+                emit_ln(node, i.gen.jac)
+                if counter <= len(node.body) - 1 and not (
+                    isinstance(i, ast.Ability)
+                    and isinstance(node.body[counter], ast.Ability)
+                    and i.gen.jac.endswith(";")
+                    or (
+                        isinstance(i, ast.Architype)
+                        and len(node.body[counter].kid[-1].kid) == 2
+                        and len(node.body[counter - 1].kid[-1].kid) == 2
+                    )
+                ):
+                    emit_ln(node, "")
             last_element = i
 
     def exit_global_vars(self, node: ast.GlobalVars) -> None:
@@ -195,11 +184,12 @@ class JacFormatPass(Pass):
 
         items: list[T],
         """
+        emit, emit_ln = self.emit, self.emit_ln
         prev_token = None
         for i, stmt in enumerate(node.kid):
             if isinstance(node.parent, (ast.EnumDef, ast.Enum)) and stmt.gen.jac == ",":
                 self.indent_level -= 1
-                self.emit_ln(node, f"{stmt.gen.jac}")
+                emit_ln(node, f"{stmt.gen.jac}")
                 self.indent_level += 1
                 prev_token = stmt
                 continue
@@ -209,7 +199,7 @@ class JacFormatPass(Pass):
                 and not isinstance(prev_token, (ast.DictVal, ast.SetVal))
             ):
                 self.indent_level -= 1
-                self.emit_ln(node, "")
+                emit_ln(node, "")
                 self.indent_level += 1
             if isinstance(stmt, ast.Token):
                 if (
@@ -217,19 +207,19 @@ class JacFormatPass(Pass):
                     and prev_token
                     and prev_token.gen.jac == "{"
                 ):
-                    self.emit_ln(node, "")
+                    emit_ln(node, "")
                     self.indent_level += 1
                 if stmt.name == Tok.LBRACE:
                     next_kid = node.kid[i + 1]
                     if isinstance(next_kid, ast.CommentToken) and next_kid.is_inline:
-                        self.emit(node, f" {stmt.value}")
+                        emit(node, f" {stmt.value}")
                     else:
-                        self.emit(node, f" {stmt.value}")
+                        emit(node, f" {stmt.value}")
                 elif stmt.name == Tok.RBRACE:
                     if self.indent_level > 0:
                         self.indent_level -= 1
                     if stmt.parent and stmt.parent.gen.jac.strip() == "{":
-                        self.emit_ln(node, stmt.gen.jac.strip())
+                        emit_ln(node, stmt.gen.jac.strip())
                     elif (
                         stmt.parent
                         and stmt.parent.parent
@@ -238,7 +228,7 @@ class JacFormatPass(Pass):
                             (ast.ElseIf, ast.IfStmt, ast.IterForStmt, ast.TryStmt),
                         )
                     ):
-                        self.emit(node, f"{stmt.value}")
+                        emit(node, f"{stmt.value}")
                     else:
                         next_kid = (
                             node.kid[i + 1]
@@ -249,14 +239,14 @@ class JacFormatPass(Pass):
                             isinstance(next_kid, ast.CommentToken)
                             and next_kid.is_inline
                         ):
-                            self.emit(node, f" {stmt.value}")
+                            emit(node, f" {stmt.value}")
                         elif not (node.gen.jac).endswith("\n"):
                             self.indent_level -= 1
-                            self.emit_ln(node, "")
+                            emit_ln(node, "")
                             self.indent_level += 1
-                            self.emit(node, f"{stmt.value}")
+                            emit(node, f"{stmt.value}")
                         else:
-                            self.emit(node, f"{stmt.value}")
+                            emit(node, f"{stmt.value}")
                 elif isinstance(stmt, ast.CommentToken):
                     if stmt.is_inline:
                         if isinstance(prev_token, ast.Semi) or (
@@ -268,47 +258,47 @@ class JacFormatPass(Pass):
                             ]
                         ):
                             self.indent_level -= 1
-                            self.emit(node, f" {stmt.gen.jac}")
-                            self.emit_ln(node, "")
+                            emit(node, f" {stmt.gen.jac}")
+                            emit_ln(node, "")
                             self.indent_level += 1
                         else:
-                            self.emit(node, f" {stmt.gen.jac}")
+                            emit(node, f" {stmt.gen.jac}")
                         self.indent_level -= 1
-                        self.emit_ln(node, "")
+                        emit_ln(node, "")
                         self.indent_level += 1
                     else:
                         if not node.gen.jac.endswith("\n"):
                             self.indent_level -= 1
-                            self.emit_ln(node, "")
+                            emit_ln(node, "")
                             self.indent_level += 1
                         if prev_token and prev_token.gen.jac.strip() == "{":
                             self.indent_level += 1
                         if prev_token and isinstance(prev_token, ast.Ability):
-                            self.emit(node, f"{stmt.gen.jac}")
+                            emit(node, f"{stmt.gen.jac}")
                         else:
-                            self.emit(node, stmt.gen.jac)
+                            emit(node, stmt.gen.jac)
                             if not stmt.gen.jac.endswith("postinit;"):
                                 self.indent_level -= 1
-                                self.emit_ln(node, "")
+                                emit_ln(node, "")
                                 self.indent_level += 1
                 elif stmt.gen.jac == ",":
-                    self.emit(node, f"{stmt.value} ")
+                    emit(node, f"{stmt.value} ")
                 elif stmt.value == "=":
-                    self.emit(node, f" {stmt.value} ")
+                    emit(node, f" {stmt.value} ")
                 else:
-                    self.emit(node, f"{stmt.value}")
+                    emit(node, f"{stmt.value}")
                 prev_token = stmt
                 continue
             elif isinstance(stmt, ast.Semi):
-                self.emit(node, stmt.gen.jac)
+                emit(node, stmt.gen.jac)
             elif isinstance(prev_token, (ast.HasVar, ast.ArchHas)) and not isinstance(
                 stmt, (ast.HasVar, ast.ArchHas)
             ):
                 if not isinstance(prev_token.kid[-1], ast.CommentToken):
                     self.indent_level -= 1
-                    self.emit_ln(node, "")
+                    emit_ln(node, "")
                     self.indent_level += 1
-                self.emit(node, stmt.gen.jac)
+                emit(node, stmt.gen.jac)
             elif isinstance(prev_token, ast.Ability) and isinstance(
                 stmt, (ast.Ability, ast.AbilityDef)
             ):
@@ -316,26 +306,26 @@ class JacFormatPass(Pass):
                     stmt.body and not isinstance(stmt.body, ast.FuncCall)
                 ):
                     self.indent_level -= 1
-                    self.emit_ln(node, "")
+                    emit_ln(node, "")
                     self.indent_level += 1
-                    self.emit(node, f"{stmt.gen.jac}")
+                    emit(node, f"{stmt.gen.jac}")
                 elif stmt.body and isinstance(
                     stmt.body, (ast.FuncCall, ast.EventSignature)
                 ):
                     self.indent_level -= 1
-                    self.emit_ln(node, "")
+                    emit_ln(node, "")
                     self.indent_level += 1
-                    self.emit(node, stmt.gen.jac)
+                    emit(node, stmt.gen.jac)
                 else:
                     self.indent_level -= 1
-                    self.emit_ln(node, "")
+                    emit_ln(node, "")
                     self.indent_level += 1
-                    self.emit(node, f"{stmt.gen.jac}")
+                    emit(node, f"{stmt.gen.jac}")
             else:
                 if prev_token and prev_token.gen.jac.strip() == "{":
-                    self.emit_ln(node, "")
+                    emit_ln(node, "")
                     self.indent_level += 1
-                self.emit(node, stmt.gen.jac)
+                emit(node, stmt.gen.jac)
             prev_token = stmt
 
     def exit_sub_tag(self, node: ast.SubTag) -> None:
@@ -375,14 +365,15 @@ class JacFormatPass(Pass):
         prev_token: Optional[AstNode] = None
         line_break_needed = False
         indented = False
-        test_str = ""
+        test_parts: list[str] = []
         for i in node.kid:
             if isinstance(i, ast.SubNodeList):
                 if prev_token and prev_token.gen.jac.strip() == "(":
-                    for j in i.kid:
-                        test_str += f" {j.gen.jac}"
-                    test_str += ");"
-                    line_break_needed = self.is_line_break_needed(test_str, 60)
+                    test_parts.extend(f" {j.gen.jac}" for j in i.kid)
+                    test_parts.append(");")
+                    line_break_needed = self.is_line_break_needed(
+                        "".join(test_parts), 60
+                    )
                 if line_break_needed:
                     self.emit_ln(node, "")
                     self.indent_level += 1
@@ -433,7 +424,7 @@ class JacFormatPass(Pass):
                     self.indent_level += 1
                 self.emit(node, i.gen.jac)
             prev_token = i
-            test_str += i.gen.jac
+            test_parts.append(i.gen.jac)
         if isinstance(node.kid[-1], (ast.Semi, ast.CommentToken)):
             self.emit_ln(node, "")
 
@@ -445,8 +436,13 @@ class JacFormatPass(Pass):
         if len(node.strings) > 1:
             self.emit_ln(node, node.strings[0].gen.jac)
             self.indent_level += 1
-            for string in range(1, len(node.strings) - 1):
-                self.emit(node, f"{node.strings[string].gen.jac}\n")
+            indent = self.indent_str()
+            node.gen.jac += "".join(
+                [
+                    indent + i.gen.jac.replace("\n", "\n" + indent) + "\n"
+                    for i in node.strings[1:-1]
+                ]
+            )
             self.emit(node, node.strings[-1].gen.jac)
             self.indent_level -= 1
         else:
@@ -1229,9 +1225,7 @@ class JacFormatPass(Pass):
 
         body: CodeBlock,
         """
-        self.emit(node, "finally")
-
-        self.emit(node, node.body.gen.jac)
+        self.emit(node, f"finally{node.body.gen.jac}")
 
     def exit_while_stmt(self, node: ast.WhileStmt) -> None:
         """Sub objects.
@@ -1275,10 +1269,8 @@ class JacFormatPass(Pass):
         exprs: "ExprAsItemList",
         body: "CodeBlock",
         """
-        self.comma_sep_node_list(node.exprs)
-        self.emit(node, f"with {node.exprs.gen.jac}")
-        if node.body.gen.jac:
-            self.emit(node, node.body.gen.jac)
+        self.sep_node_list(node.exprs, ", ")
+        self.emit(node, f"with {node.exprs.gen.jac}{node.body.gen.jac}")
 
     def exit_module_item(self, node: ast.ModuleItem) -> None:
         """Sub objects.
@@ -1455,11 +1447,7 @@ class JacFormatPass(Pass):
         values: list[Expr],
         """
         end = node.values[-1]
-        test_str = ""
-        for i in node.values:
-            test_str += f"{i.gen.jac}"
-            if i != end:
-                test_str += f" {node.op.value} "
+        test_str = f" {node.op.value} ".join([i.gen.jac for i in node.values])
 
         # Check if line break is needed
         if self.is_line_break_needed(test_str):
@@ -1471,7 +1459,7 @@ class JacFormatPass(Pass):
                 if i != end:
                     self.emit(
                         node,
-                        " " * self.indent_size + f"{node.op.value} ",
+                        f"{self.indent_cache[1]}{node.op.value} ",
                         strip_mode=False,
                     )
         else:
@@ -1483,13 +1471,12 @@ class JacFormatPass(Pass):
         signature: FuncSignature,
         body: Expr,
         """
-        out = ""
+        out: list[str] = []
         if node.signature and node.signature.params:
-            self.comma_sep_node_list(node.signature.params)
-            out += node.signature.params.gen.jac
+            out.append(self.sep_node_list(node.signature.params, ", "))
         if node.signature and node.signature.return_type:
-            out += f" -> {node.signature.return_type.gen.jac}"
-        self.emit(node, f"with {out} can {node.body.gen.jac}")
+            out.append(f" -> {node.signature.return_type.gen.jac}")
+        self.emit(node, f"with {''.join(out)} can {node.body.gen.jac}")
 
     def exit_unary_expr(self, node: ast.UnaryExpr) -> None:
         """Sub objects.
@@ -1608,10 +1595,7 @@ class JacFormatPass(Pass):
         indented = False
         test_str = ""
         if node.kv_pairs:
-            test_str = "{"
-            for j in node.kv_pairs:
-                test_str += f"{j.gen.jac}"
-            test_str += "};"
+            test_str = "{" + "".join([j.gen.jac for j in node.kv_pairs]) + "};"
         for i in node.kid:
             if isinstance(i, ast.CommentToken):
                 if i.is_inline:
@@ -2026,9 +2010,7 @@ class JacFormatPass(Pass):
 
         code: Token,
         """
-        self.emit_ln(node, "::py::")
-        self.emit_ln(node, node.code.value)
-        self.emit_ln(node, "::py::")
+        self.emit(node, f"::py::\n{node.code.value.strip()}\n::py::\n")
 
     def exit_arch_ref_chain(self, node: ast.ArchRefChain) -> None:
         """Sub objects.
@@ -9,7 +9,7 @@ from jaclang.compiler.passes.tool.fuse_comments_pass import (
 from jaclang.compiler.passes.tool.jac_formatter_pass import JacFormatPass  # noqa: I100
 
 
-format_pass: list[Type[Pass]] = [FuseCommentsPass, JacFormatPass]
+format_pass: tuple[Type[Pass], ...] = (FuseCommentsPass, JacFormatPass)
 
 __all__ = [
     "FuseCommentsPass",
@@ -40,6 +40,25 @@ mypy_to_jac_node_map: dict[
     tuple[int, int | None, int | None, int | None], list[AstNode]
 ] = {}
 
+# Deserialized typeshed stdlib trees kept alive across builds in this process,
+# keyed by module id and validated against the cache data file they were loaded
+# from. Cached trees cross-reference each other, so the cache is only ever
+# dropped as a whole, when a tree goes stale or the cache fills up.
+TYPESHED_DIR = str(
+    pathlib.Path(os.path.dirname(jaclang.__file__))
+    / "vendor"
+    / "mypy"
+    / "typeshed"
+    / "stdlib"
+)
+FRESH_TREE_CACHE_SIZE = 512
+fresh_tree_cache: dict[str, tuple[tuple[str, int, str], myb.MypyFile]] = {}
+
+
+def clear_fresh_tree_cache() -> None:
+    """Drop the typeshed trees kept from earlier builds."""
+    fresh_tree_cache.clear()
+
 
 class BuildManager(myb.BuildManager):
     """Overrides to mypy build manager for direct AST pass through."""
@@ -150,6 +169,7 @@ class State(myb.State):
 
     manager: BuildManager
     tree: myb.MypyFile | None = None
+    tree_fixed: bool = False
 
     def __init__(
         self,
@@ -294,6 +314,35 @@ class State(myb.State):
 
         return self._type_checker
 
+    def load_tree(self, temporary: bool = False) -> None:
+        """Load the tree from cache, reusing typeshed trees loaded earlier."""
+        if (
+            temporary
+            or not self.meta
+            or not self.xpath.startswith(TYPESHED_DIR + os.sep)
+        ):
+            return super().load_tree(temporary=temporary)
+        key = (self.meta.data_json, self.meta.data_mtime, self.meta.interface_hash)
+        cached = fresh_tree_cache.get(self.id)
+        if cached:
+            if cached[0] == key:
+                self.tree = cached[1]
+                self.tree_fixed = True
+                self.manager.modules[self.id] = self.tree
+                self.manager.add_stats(fresh_trees=1)
+                return
+            clear_fresh_tree_cache()
+        super().load_tree()
+        if self.tree is not None:
+            if len(fresh_tree_cache) >= FRESH_TREE_CACHE_SIZE:
+                clear_fresh_tree_cache()
+            fresh_tree_cache[self.id] = (key, self.tree)
+
+    def fix_cross_refs(self) -> None:
+        """Fix cross references, skipping trees already fixed up earlier."""
+        if not self.tree_fixed:
+            super().fix_cross_refs()
+
     def parse_file(
         self, *, temporary: bool = False, ast_override: myb.MypyFile | None = None
     ) -> None:
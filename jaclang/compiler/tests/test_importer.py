@@ -1,10 +1,14 @@
 """Tests for Jac Loader."""
 
 import io
+import os
 import sys
+from unittest.mock import patch
 
 from jaclang import jac_import
 from jaclang.cli import cli
+from jaclang.core import importer
+from jaclang.utils.helpers import jbc_header
 from jaclang.utils.test import TestCase
 
 
@@ -26,6 +30,46 @@ class TestLoader(TestCase):
         self.assertIn("module 'hello_world'", str(sys.modules))
         self.assertIn("/tests/fixtures/hello_world.jac", str(sys.modules))
 
+    def test_reimport_uses_code_cache(self) -> None:
+        """Test unchanged modules are not recompiled on reimport."""
+        for name in ("fixtures.hello_world", "hello_world"):
+            sys.modules.pop(name, None)
+        jac_import("fixtures.hello_world", base_path=__file__)
+        for name in ("fixtures.hello_world", "hello_world"):
+            sys.modules.pop(name, None)
+        with patch.object(
+            importer, "compile_jac", wraps=importer.compile_jac
+        ) as compile_jac, patch.object(
+            importer.marshal, "load", wraps=importer.marshal.load
+        ) as load_jbc:
+            h = jac_import("fixtures.hello_world", base_path=__file__)
+        self.assertEqual(h.hello(), "Hello World!")  # type: ignore
+        compile_jac.assert_not_called()
+        load_jbc.assert_not_called()
+        self.assertTrue(
+            any(k[0].endswith("hello_world.jac") for k in importer._code_cache)
+        )
+
+    def test_jbc_cache_checks_source_hash(self) -> None:
+        """Test cached bytecode is only reused for the exact same source."""
+        src = self.fixture_abs_path("hello_world.jac")
+        jbc = self.fixture_abs_path(os.path.join("__jac_gen__", "hello_world.jbc"))
+        for name in ("fixtures.hello_world", "hello_world"):
+            sys.modules.pop(name, None)
+        importer._code_cache.clear()
+        jac_import("fixtures.hello_world", base_path=__file__)
+        with open(jbc, "rb") as f:
+            self.assertEqual(f.read(len(jbc_header(src))), jbc_header(src))
+        with open(jbc, "r+b") as f:
+            f.write(b"\0" * len(jbc_header(src)))
+        for name in ("fixtures.hello_world", "hello_world"):
+            sys.modules.pop(name, None)
+        importer._code_cache.clear()
+        h = jac_import("fixtures.hello_world", base_path=__file__)
+        self.assertEqual(h.hello(), "Hello World!")  # type: ignore
+        with open(jbc, "rb") as f:
+            self.assertEqual(f.read(len(jbc_header(src))), jbc_header(src))
+
     def test_jac_py_import(self) -> None:
         """Basic test for pass."""
         captured_output = io.StringIO()
@@ -1,9 +1,11 @@
 """Tests for Jac parser."""
 
 import inspect
+import pickle
 
 from jaclang.compiler import jac_lark as jl
 from jaclang.compiler.absyntree import JacSource
+from jaclang.compiler.codeloc import CodeGenTarget, CodeLocInfo
 from jaclang.compiler.constant import Tokens
 from jaclang.compiler.parser import JacParser
 from jaclang.utils.test import TestCaseMicroSuite
@@ -34,6 +36,44 @@ class TestLarkParser(TestCaseMicroSuite):
         prse = JacParser(input_ir=JacSource(self.load_fixture("fam.jac"), mod_path=""))
         self.assertFalse(prse.errors_had)
 
+    def test_unpickle_node_with_meta_dict(self) -> None:
+        """Test nodes pickled with a plain meta dict still load."""
+        prse = JacParser(input_ir=JacSource(self.load_fixture("fam.jac"), mod_path=""))
+        mod = prse.ir
+        mod.__dict__["meta"] = {"py_code": "x = 1"}
+        del mod.__dict__["_meta"]
+        loaded = pickle.loads(pickle.dumps(mod))
+        self.assertEqual(loaded.meta, {"py_code": "x = 1"})
+        self.assertEqual(loaded.kid[0].meta, {})
+
+    def test_unpickle_codeloc_with_dict_state(self) -> None:
+        """Test code locations and gen targets pickled before slots still load."""
+
+        class DictStatePickle:
+            """Pickles the way instances did before their classes had slots."""
+
+            def __init__(self, cls: type, state: dict) -> None:
+                self.cls, self.state = cls, state
+
+            def __reduce_ex__(self, protocol: int) -> tuple:
+                return object.__new__, (self.cls,), self.state
+
+        prse = JacParser(input_ir=JacSource(self.load_fixture("fam.jac"), mod_path=""))
+        loc = prse.ir.loc
+        old_loc = DictStatePickle(
+            CodeLocInfo, {"first_tok": loc.first_tok, "last_tok": loc.last_tok}
+        )
+        loaded_loc = pickle.loads(pickle.dumps(old_loc))
+        self.assertEqual(str(loaded_loc), str(loc))
+        old_gen = DictStatePickle(
+            CodeGenTarget,
+            {"py": "x = 1", "jac": "", "py_ast": [], "mypy_ast": []},
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(old_gen)).py, "x = 1")
+        loaded = pickle.loads(pickle.dumps(prse.ir))
+        self.assertEqual(str(loaded.loc), str(loc))
+        self.assertEqual(loaded.gen, prse.ir.gen)
+
     def test_staticmethod_checks_out(self) -> None:
         """Parse micro jac file."""
         prse = JacParser(
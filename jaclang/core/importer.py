@@ -4,15 +4,19 @@ import importlib
 import marshal
 import sys
 import types
-from os import getcwd, path
+from os import getcwd, path, stat
 from typing import Optional, Union
 
 from jaclang.compiler.absyntree import Module
 from jaclang.compiler.compile import compile_jac
 from jaclang.compiler.constant import Constants as Con
 from jaclang.core.utils import sys_path_context
+from jaclang.utils.helpers import jbc_header
 from jaclang.utils.log import logging
 
+# Compiled module code keyed by (absolute path, source mtime_ns, source size).
+_code_cache: dict[tuple[str, int, int], types.CodeType] = {}
+
 
 def jac_importer(
     target: str,
@@ -53,16 +57,21 @@ def jac_importer(
             codeobj = mod_bundle.mod_deps[full_target].gen.py_bytecode
             codeobj = marshal.loads(codeobj) if isinstance(codeobj, bytes) else None
         else:
+            src_stat = stat(full_target)
+            cache_key = (
+                path.abspath(full_target),
+                src_stat.st_mtime_ns,
+                src_stat.st_size,
+            )
             gen_dir = path.join(caller_dir, Con.JAC_GEN_DIR)
             pyc_file_path = path.join(gen_dir, module_name + ".jbc")
-            if (
-                cachable
-                and path.exists(pyc_file_path)
-                and path.getmtime(pyc_file_path) > path.getmtime(full_target)
-            ):
+            codeobj = _code_cache.get(cache_key) if cachable else None
+            if codeobj is None and cachable and path.exists(pyc_file_path):
+                header = jbc_header(full_target)
                 with open(pyc_file_path, "rb") as f:
-                    codeobj = marshal.load(f)
-            else:
+                    if f.read(len(header)) == header:
+                        codeobj = marshal.load(f)
+            if codeobj is None:
                 result = compile_jac(full_target, cache_result=cachable)
                 if result.errors_had or not result.ir.gen.py_bytecode:
                     for e in result.errors_had:
@@ -71,6 +80,8 @@ def jac_importer(
                     return None
                 else:
                     codeobj = marshal.loads(result.ir.gen.py_bytecode)
+            if cachable and isinstance(codeobj, types.CodeType):
+                _code_cache[cache_key] = codeobj
         if not codeobj:
             raise ImportError(f"No bytecode found for {full_target}")
         with sys_path_context(caller_dir):
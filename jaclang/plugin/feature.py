@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import abc
 import types
 from typing import Any, Callable, Optional, Type, Union
 
 from jaclang.compiler.absyntree import Module
+from jaclang.compiler.constant import EdgeDir
 from jaclang.core.construct import (
     Architype,
     EdgeArchitype,
@@ -13,23 +15,91 @@ from jaclang.core.construct import (
     Root,
     WalkerArchitype,
 )
-from jaclang.plugin.spec import JacBuiltin, JacCmdSpec, JacFeatureSpec, T
+from jaclang.plugin.spec import DSFunc, JacBuiltin, JacCmdSpec, JacFeatureSpec, T
 
 
 import pluggy
 
-pm = pluggy.PluginManager("jac")
+
+class JacPluginManager(pluggy.PluginManager):
+    """Plugin manager that keeps JacFeature's resolved hooks current."""
+
+    monitors: int = 0
+
+    def register(self, plugin: object, name: Optional[str] = None) -> Optional[str]:
+        """Register a plugin and re-resolve hooks."""
+        ret = super().register(plugin, name)
+        JacFeature.refresh()
+        return ret
+
+    def unregister(
+        self, plugin: Optional[object] = None, name: Optional[str] = None
+    ) -> Any:  # noqa: ANN401
+        """Unregister a plugin and re-resolve hooks."""
+        ret = super().unregister(plugin, name)
+        JacFeature.refresh()
+        return ret
+
+    def add_hookcall_monitoring(
+        self, before: Callable[..., None], after: Callable[..., None]
+    ) -> Callable[[], None]:
+        """Add hook call tracers, routing every hook through pluggy meanwhile."""
+        undo = super().add_hookcall_monitoring(before, after)
+        self.monitors += 1
+        JacFeature.refresh()
+
+        def undo_and_refresh() -> None:
+            undo()
+            self.monitors -= 1
+            JacFeature.refresh()
+
+        return undo_and_refresh
+
+
+pm = JacPluginManager("jac")
 pm.add_hookspecs(JacFeatureSpec)
 pm.add_hookspecs(JacCmdSpec)
 pm.add_hookspecs(JacBuiltin)
 
+# Hook callables used by JacFeature, resolved by JacFeature.refresh().
+hooks = types.SimpleNamespace()
+
 
 class JacFeature:
     """Jac Feature."""
 
-    import abc
-    from jaclang.plugin.spec import DSFunc
-    from jaclang.compiler.constant import EdgeDir
+    # Re-exported for generated code, which reaches these through Jac.
+    abc = abc
+    DSFunc = DSFunc
+    EdgeDir = EdgeDir
+
+    @staticmethod
+    def refresh() -> None:
+        """Resolve hooks, calling sole implementations directly.
+
+        A first-result hook with a single plain implementation whose arguments
+        match its spec is bound to that function, skipping pluggy's per-call
+        dispatch. Any other hook keeps going through its pluggy hook caller, as
+        do all hooks while hook call monitoring (or tracing) is active, so the
+        monitors see every call.
+        """
+        direct = not pm.monitors
+        for name in JacFeatureSpec.__dict__:
+            caller = getattr(pm.hook, name, None)
+            if not isinstance(caller, pluggy.HookCaller):
+                continue
+            impls = caller.get_hookimpls()
+            if (
+                direct
+                and caller.spec is not None
+                and caller.spec.opts.get("firstresult")
+                and len(impls) == 1
+                and not (impls[0].wrapper or impls[0].hookwrapper)
+                and impls[0].argnames == caller.spec.argnames
+            ):
+                setattr(hooks, name, impls[0].function)
+            else:
+                setattr(hooks, name, caller)
 
     @staticmethod
     def make_architype(
@@ -39,7 +109,7 @@ class JacFeature:
         on_exit: list[DSFunc],
     ) -> Type[Architype]:
         """Create a obj architype."""
-        return pm.hook.make_architype(
+        return hooks.make_architype(
             cls=cls, on_entry=on_entry, on_exit=on_exit, arch_base=arch_base
         )
 
@@ -48,28 +118,28 @@ class JacFeature:
         on_entry: list[DSFunc], on_exit: list[DSFunc]
     ) -> Callable[[type], type]:
         """Create a obj architype."""
-        return pm.hook.make_obj(on_entry=on_entry, on_exit=on_exit)
+        return hooks.make_obj(on_entry=on_entry, on_exit=on_exit)
 
     @staticmethod
     def make_node(
         on_entry: list[DSFunc], on_exit: list[DSFunc]
     ) -> Callable[[type], type]:
         """Create a node architype."""
-        return pm.hook.make_node(on_entry=on_entry, on_exit=on_exit)
+        return hooks.make_node(on_entry=on_entry, on_exit=on_exit)
 
     @staticmethod
     def make_edge(
         on_entry: list[DSFunc], on_exit: list[DSFunc]
     ) -> Callable[[type], type]:
         """Create a edge architype."""
-        return pm.hook.make_edge(on_entry=on_entry, on_exit=on_exit)
+        return hooks.make_edge(on_entry=on_entry, on_exit=on_exit)
 
     @staticmethod
     def make_walker(
         on_entry: list[DSFunc], on_exit: list[DSFunc]
     ) -> Callable[[type], type]:
         """Create a walker architype."""
-        return pm.hook.make_walker(on_entry=on_entry, on_exit=on_exit)
+        return hooks.make_walker(on_entry=on_entry, on_exit=on_exit)
 
     @staticmethod
     def jac_import(
@@ -84,7 +154,7 @@ class JacFeature:
         items: Optional[dict[str, Union[str, bool]]] = None,
     ) -> Optional[types.ModuleType]:
         """Core Import Process."""
-        return pm.hook.jac_import(
+        return hooks.jac_import(
             target=target,
             base_path=base_path,
             absorb=absorb,
@@ -99,7 +169,7 @@ class JacFeature:
     @staticmethod
     def create_test(test_fun: Callable) -> Callable:
         """Create a test."""
-        return pm.hook.create_test(test_fun=test_fun)
+        return hooks.create_test(test_fun=test_fun)
 
     @staticmethod
     def run_test(
@@ -111,7 +181,7 @@ class JacFeature:
         verbose: bool = False,
     ) -> bool:
         """Run the test suite in the specified .jac file."""
-        return pm.hook.run_test(
+        return hooks.run_test(
             filepath=filepath,
             filter=filter,
             xit=xit,
@@ -123,22 +193,22 @@ class JacFeature:
     @staticmethod
     def elvis(op1: Optional[T], op2: T) -> T:
         """Jac's elvis operator feature."""
-        return pm.hook.elvis(op1=op1, op2=op2)
+        return hooks.elvis(op1=op1, op2=op2)
 
     @staticmethod
     def has_instance_default(gen_func: Callable[[], T]) -> T:
         """Jac's has container default feature."""
-        return pm.hook.has_instance_default(gen_func=gen_func)
+        return hooks.has_instance_default(gen_func=gen_func)
 
     @staticmethod
     def spawn_call(op1: Architype, op2: Architype) -> WalkerArchitype:
         """Jac's spawn operator feature."""
-        return pm.hook.spawn_call(op1=op1, op2=op2)
+        return hooks.spawn_call(op1=op1, op2=op2)
 
     @staticmethod
     def report(expr: Any) -> Any:  # noqa: ANN401
         """Jac's report stmt feature."""
-        return pm.hook.report(expr=expr)
+        return hooks.report(expr=expr)
 
     @staticmethod
     def ignore(
@@ -146,7 +216,7 @@ class JacFeature:
         expr: list[NodeArchitype | EdgeArchitype] | NodeArchitype | EdgeArchitype,
     ) -> bool:  # noqa: ANN401
         """Jac's ignore stmt feature."""
-        return pm.hook.ignore(walker=walker, expr=expr)
+        return hooks.ignore(walker=walker, expr=expr)
 
     @staticmethod
     def visit_node(
@@ -154,12 +224,12 @@ class JacFeature:
         expr: list[NodeArchitype | EdgeArchitype] | NodeArchitype | EdgeArchitype,
     ) -> bool:  # noqa: ANN401
         """Jac's visit stmt feature."""
-        return pm.hook.visit_node(walker=walker, expr=expr)
+        return hooks.visit_node(walker=walker, expr=expr)
 
     @staticmethod
     def disengage(walker: WalkerArchitype) -> bool:  # noqa: ANN401
         """Jac's disengage stmt feature."""
-        return pm.hook.disengage(walker=walker)
+        return hooks.disengage(walker=walker)
 
     @staticmethod
     def edge_ref(
@@ -170,7 +240,7 @@ class JacFeature:
         edges_only: bool = False,
     ) -> list[NodeArchitype] | list[EdgeArchitype]:
         """Jac's apply_dir stmt feature."""
-        return pm.hook.edge_ref(
+        return hooks.edge_ref(
             node_obj=node_obj,
             target_obj=target_obj,
             dir=dir,
@@ -189,7 +259,7 @@ class JacFeature:
 
         Note: connect needs to call assign compr with tuple in op
         """
-        return pm.hook.connect(
+        return hooks.connect(
             left=left, right=right, edge_spec=edge_spec, edges_only=edges_only
         )
 
@@ -201,7 +271,7 @@ class JacFeature:
         filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
     ) -> bool:
         """Jac's disconnect operator feature."""
-        return pm.hook.disconnect(
+        return hooks.disconnect(
             left=left,
             right=right,
             dir=dir,
@@ -213,17 +283,17 @@ class JacFeature:
         target: list[T], attr_val: tuple[tuple[str], tuple[Any]]
     ) -> list[T]:
         """Jac's assign comprehension feature."""
-        return pm.hook.assign_compr(target=target, attr_val=attr_val)
+        return hooks.assign_compr(target=target, attr_val=attr_val)
 
     @staticmethod
     def get_root() -> Root:
         """Jac's root getter."""
-        return pm.hook.get_root()
+        return hooks.get_root()
 
     @staticmethod
     def get_root_type() -> Type[Root]:
         """Jac's root type getter."""
-        return pm.hook.get_root_type()
+        return hooks.get_root_type()
 
     @staticmethod
     def build_edge(
@@ -232,7 +302,7 @@ class JacFeature:
         conn_assign: Optional[tuple[tuple, tuple]],
     ) -> Callable[[], EdgeArchitype]:
         """Jac's root getter."""
-        return pm.hook.build_edge(
+        return hooks.build_edge(
             is_undirected=is_undirected, conn_type=conn_type, conn_assign=conn_assign
         )
 
@@ -241,19 +311,19 @@ class JacFeature:
         file_loc: str, scope: str, attr: str, return_semstr: bool
     ) -> Optional[str]:
         """Jac's get_semstr_type feature."""
-        return pm.hook.get_semstr_type(
+        return hooks.get_semstr_type(
             file_loc=file_loc, scope=scope, attr=attr, return_semstr=return_semstr
         )
 
     @staticmethod
     def obj_scope(file_loc: str, attr: str) -> str:
         """Jac's get_semstr_type feature."""
-        return pm.hook.obj_scope(file_loc=file_loc, attr=attr)
+        return hooks.obj_scope(file_loc=file_loc, attr=attr)
 
     @staticmethod
     def get_sem_type(file_loc: str, attr: str) -> tuple[str | None, str | None]:
         """Jac's get_semstr_type feature."""
-        return pm.hook.get_sem_type(file_loc=file_loc, attr=attr)
+        return hooks.get_sem_type(file_loc=file_loc, attr=attr)
 
     @staticmethod
     def with_llm(
@@ -268,7 +338,7 @@ class JacFeature:
         action: str,
     ) -> Any:  # noqa: ANN401
         """Jac's with_llm feature."""
-        return pm.hook.with_llm(
+        return hooks.with_llm(
             file_loc=file_loc,
             model=model,
             model_params=model_params,
@@ -281,6 +351,9 @@ class JacFeature:
         )
 
 
+JacFeature.refresh()
+
+
 class JacCmd:
     """Jac CLI command."""
 
@@ -7,8 +7,8 @@ import traceback
 from typing import List, Type
 
 from jaclang.cli import cli
-from jaclang.plugin.default import JacFeatureDefaults
-from jaclang.plugin.feature import JacFeature
+from jaclang.plugin.default import JacFeatureDefaults, hookimpl
+from jaclang.plugin.feature import JacFeature, pm
 from jaclang.plugin.spec import JacFeatureSpec
 from jaclang.utils.test import TestCase
 
@@ -59,6 +59,41 @@ class TestFeatures(TestCase):
         for i in jac_feature_spec_methods:
             self.assertIn(i, jac_feature_methods)
 
+    def test_registered_plugin_overrides_feature(self) -> None:
+        """Test registering a plugin re-resolves JacFeature's hooks."""
+
+        class ElvisPlugin:
+            """Plugin overriding the elvis operator."""
+
+            @staticmethod
+            @hookimpl
+            def elvis(op1: object, op2: object) -> object:
+                """Always pick the right operand."""
+                return op2
+
+        self.assertEqual(JacFeature.elvis(1, 2), 1)
+        pm.register(ElvisPlugin)
+        try:
+            self.assertEqual(JacFeature.elvis(1, 2), 2)
+        finally:
+            pm.unregister(ElvisPlugin)
+        self.assertEqual(JacFeature.elvis(1, 2), 1)
+
+    def test_hookcall_monitoring_sees_features(self) -> None:
+        """Test hook call monitors see calls to directly bound features."""
+        called: list[str] = []
+        undo = pm.add_hookcall_monitoring(
+            lambda name, impls, kwargs: called.append(name),
+            lambda outcome, name, impls, kwargs: None,
+        )
+        try:
+            self.assertEqual(JacFeature.elvis(None, 2), 2)
+        finally:
+            undo()
+        self.assertEqual(called, ["elvis"])
+        JacFeature.elvis(None, 2)
+        self.assertEqual(called, ["elvis"])
+
     def test_impl_match_error_reporting(self) -> None:
         """Basic test for error reporting."""
         captured_output = io.StringIO()
@@ -5,6 +5,8 @@ import io
 import os
 import subprocess
 import sys
+import tempfile
+from unittest.mock import patch
 
 from jaclang.cli import cli
 from jaclang.plugin.builtin import dotgen
@@ -237,3 +239,30 @@ class JacCliTests(TestCase):
         sys.stdout = sys.__stdout__
         stdout_value = captured_output.getvalue()
         self.assertIn("can my_print(x: object) -> None", stdout_value)
+
+    def test_clean_skips_unreadable_folders(self) -> None:
+        """Test clean skips folders it cannot read instead of aborting."""
+        scandir = os.scandir
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for folder in ("locked/__jac_gen__", "open/__jac_gen__"):
+                os.makedirs(os.path.join(tmp, folder))
+
+            def guarded_scandir(path: str | int) -> object:
+                if isinstance(path, str) and os.path.basename(path) == "locked":
+                    raise PermissionError(path)
+                return scandir(path)
+
+            cwd = os.getcwd()
+            captured_output = io.StringIO()
+            sys.stdout = captured_output
+            try:
+                os.chdir(tmp)
+                with patch("os.scandir", guarded_scandir):
+                    cli.clean()
+            finally:
+                os.chdir(cwd)
+                sys.stdout = sys.__stdout__
+            self.assertIn("Done cleaning.", captured_output.getvalue())
+            self.assertFalse(os.path.exists(os.path.join(tmp, "open/__jac_gen__")))
+            self.assertTrue(os.path.exists(os.path.join(tmp, "locked/__jac_gen__")))
@@ -1,95 +1,203 @@
 """Test Jac reference examples."""
 
-import io
+import builtins
+import marshal
 import os
-from contextlib import redirect_stdout
-from typing import Callable, Optional
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from types import CodeType
+from typing import Callable, Iterator, Optional
 
 import jaclang
 import jaclang.core.construct as jcon
 from jaclang.compiler.compile import jac_file_to_pass
+from jaclang.compiler.constant import Constants as Con
 from jaclang.utils.test import TestCase
 
+_REF_ROOT = os.path.normpath(
+    os.path.join(
+        os.path.dirname(os.path.dirname(jaclang.__file__)), "examples", "reference"
+    )
+)
+
+_SKIP_DIRS = frozenset({"__pycache__", Con.JAC_GEN_DIR.value})
+
+
+def _scan_jac(root: str) -> Iterator[tuple[str, Optional[os.DirEntry]]]:
+    """Yield reference .jac files under root with their sibling .py entries.
+
+    Dirs that hold no examples are pruned.
+    """
+    with os.scandir(root) as it:
+        by_name = {entry.name: entry for entry in it}
+    for name, entry in by_name.items():
+        if entry.is_dir(follow_symlinks=False):
+            if name not in _SKIP_DIRS and not name.startswith((".", "err")):
+                yield from _scan_jac(entry.path)
+        elif name.endswith(".jac") and not name.startswith("err"):
+            yield entry.path, by_name.get(name[:-4] + ".py")
+
+
+# Compiled reference examples keyed on the .jac path and the mtimes of both the
+# .jac and its .py reference, reused across class setups in the same process
+# until either source file changes.
+_compile_cache: dict[
+    tuple[str, int, int], tuple[CodeType, CodeType] | Exception
+] = {}
+
+
+def _cache_key(filename: str) -> tuple[str, int, int]:
+    """Key a reference example on its path and both sources' mtimes."""
+    return (
+        filename,
+        os.stat(filename).st_mtime_ns,
+        os.stat(filename[:-4] + ".py").st_mtime_ns,
+    )
+
+
+def _compile_ref(filename: str) -> tuple[bytes, bytes] | Exception:
+    """Compile a reference .jac file and its .py counterpart.
+
+    The code objects are returned marshalled so they can come back from a worker
+    process, and errors are returned rather than raised so a broken example
+    fails on its own.
+    """
+    try:
+        jacast = jac_file_to_pass(filename).ir
+        jac_code = compile(
+            source=jacast.gen.py_ast[0],
+            filename=jacast.loc.mod_path,
+            mode="exec",
+        )
+        py_filename = filename[:-4] + ".py"
+        with open(py_filename, "rb") as file:
+            py_code = compile(file.read(), py_filename, "exec")
+    except Exception as e:
+        return e
+    return marshal.dumps(jac_code), marshal.dumps(py_code)
+
+
+def _unmarshal_ref(
+    result: tuple[bytes, bytes] | Exception,
+) -> tuple[CodeType, CodeType] | Exception:
+    """Turn a _compile_ref result back into code objects."""
+    if isinstance(result, Exception):
+        return result
+    return marshal.loads(result[0]), marshal.loads(result[1])
+
+
+def _load_ref(filename: str) -> tuple[CodeType, CodeType] | Exception:
+    """Get the compiled pair for filename, compiling on first access."""
+    key = _cache_key(filename)
+    result = _compile_cache.get(key)
+    if result is None:
+        result = _compile_cache[key] = _unmarshal_ref(_compile_ref(filename))
+    return result
+
+
+# Globals every example runs under; builtins are seeded so exec need not add them.
+_EXEC_GLOBALS = {
+    "__builtins__": builtins,
+    "__name__": "__main__",
+    "__jac_mod_bundle__": None,
+}
+
+
+class _OutputSink:
+    """Minimal stdout stand-in that collects written text."""
+
+    def __init__(self) -> None:
+        """Initialize sink."""
+        self.chunks: list[str] = []
+
+    def write(self, text: str) -> int:
+        """Collect text."""
+        self.chunks.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        """Nothing is buffered."""
+
 
 class JacReferenceTests(TestCase):
     """Test Reference examples."""
 
     test_ref_jac_files_fully_tested: Optional[Callable[[TestCase], None]] = None
     methods: list[str] = []
+    filenames: list[str] = []
 
     @classmethod
     def self_attach_ref_tests(cls) -> None:
         """Attach micro tests."""
-        for filename in [
-            os.path.normpath(os.path.join(root, name))
-            for root, _, files in os.walk(
-                os.path.join(
-                    os.path.dirname(os.path.dirname(jaclang.__file__)),
-                    "examples/reference",
-                )
-            )
-            for name in files
-            if name.endswith(".jac") and not name.startswith("err")
-        ]:
-            method_name = (
-                f"test_ref_{filename.replace('.jac', '').replace(os.sep, '_')}"
-            )
+        for filename, py_entry in _scan_jac(_REF_ROOT):
+            # Paths end in ".jac", so slicing derives the names without rescanning.
+            suffix = os.path.relpath(filename, _REF_ROOT)[:-4].replace(os.sep, "_")
+            method_name = f"test_ref_{suffix}"
             cls.methods.append(method_name)
-            setattr(cls, method_name, lambda self, f=filename: self.micro_suite_test(f))
+            if py_entry is None:
+                reason = "No"
+            elif not py_entry.stat().st_size:
+                reason = "Empty"
+            else:
+                reason = None
+            if reason:
+                msg = f"{reason} .py reference for {filename}"
+                setattr(cls, method_name, lambda self, m=msg: self.skipTest(m))
+                continue
+            cls.filenames.append(filename)
+            setattr(
+                cls,
+                method_name,
+                lambda self, f=filename, p=py_entry.path: self.micro_suite_test(f, p),
+            )
 
         def test_ref_jac_files_fully_tested(self: TestCase) -> None:  # noqa: ANN001
             """Test that all micro jac files are fully tested."""
-            for filename in cls.methods:
-                if os.path.isfile(filename):
-                    method_name = (
-                        f"test_ref_{filename.replace('.jac', '').replace(os.sep, '_')}"
-                    )
-                    self.assertIn(method_name, dir(self))
+            self.assertFalse([m for m in cls.methods if not hasattr(self, m)])
 
         cls.test_ref_jac_files_fully_tested = test_ref_jac_files_fully_tested
 
-    def micro_suite_test(self, filename: str) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Warm the compile cache in parallel; tests fall back to _load_ref."""
+        super().setUpClass()
+        keys = {f: _cache_key(f) for f in cls.filenames if "tests.jac" not in f}
+        to_compile = [f for f, key in keys.items() if key not in _compile_cache]
+        if len(to_compile) > 1:
+            try:
+                with ProcessPoolExecutor() as executor:
+                    results = list(executor.map(_compile_ref, to_compile))
+            except Exception:  # no usable worker processes, compile lazily
+                return
+            for f, result in zip(to_compile, results):
+                _compile_cache[keys[f]] = _unmarshal_ref(result)
+
+    def micro_suite_test(self, filename: str, py_filename: str) -> None:
         """Test file."""
 
-        def execute_and_capture_output(code: str | bytes, filename: str = "") -> str:
+        def execute_and_capture_output(code: CodeType, filename: str = "") -> str:
             jcon.root.reset()
-            f = io.StringIO()
-            with redirect_stdout(f):
-                exec(
-                    code,
-                    {
-                        "__file__": filename,
-                        "__name__": "__main__",
-                        "__jac_mod_bundle__": None,
-                    },
-                )
-            return f.getvalue()
-
-        try:
-            if "tests.jac" in filename:
-                return
-            jacast = jac_file_to_pass(filename).ir
-            code_content = compile(
-                source=jacast.gen.py_ast[0],
-                filename=jacast.loc.mod_path,
-                mode="exec",
-            )
-            output_jac = execute_and_capture_output(code_content, filename=filename)
-
-            filename = filename.replace(".jac", ".py")
-            with open(filename, "r") as file:
-                code_content = file.read()
-            output_py = execute_and_capture_output(code_content, filename=filename)
-
-            # print(f"\nJAC Output:\n{output_jac}")
-            # print(f"\nPython Output:\n{output_py}")
-
-            self.assertGreater(len(output_py), 0)
-            self.assertEqual(output_py, output_jac)
-        except Exception as e:
-            # print(f"\nJAC Output:\n{output_jac}")
-            # print(f"\nPython Output:\n{output_py}")
-            raise e
+            sink, stdout = _OutputSink(), sys.stdout
+            sys.stdout = sink  # type: ignore
+            try:
+                exec(code, {**_EXEC_GLOBALS, "__file__": filename})
+            finally:
+                sys.stdout = stdout
+            return "".join(sink.chunks)
+
+        if "tests.jac" in filename:
+            return
+        result = _load_ref(filename)
+        if isinstance(result, Exception):
+            raise result
+        jac_code, py_code = result
+        output_jac = execute_and_capture_output(jac_code, filename=filename)
+        output_py = execute_and_capture_output(py_code, filename=py_filename)
+
+        # print(f"\nJAC Output:\n{output_jac}")
+        # print(f"\nPython Output:\n{output_py}")
+
+        self.assertEqual(output_py, output_jac)
 
 
 JacReferenceTests.self_attach_ref_tests()
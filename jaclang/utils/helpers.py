@@ -1,6 +1,8 @@
 """Utility functions and classes for Jac compilation toolchain."""
 
 import dis
+import hashlib
+import importlib.util
 import marshal
 import os
 import pdb
@@ -149,6 +151,12 @@ def import_target_to_relative_path(
     return relative_path
 
 
+def jbc_header(source_path: str) -> bytes:
+    """Header tying a .jbc file to the interpreter and its exact source."""
+    with open(source_path, "rb") as f:
+        return importlib.util.MAGIC_NUMBER + hashlib.sha256(f.read()).digest()
+
+
 class Jdb(pdb.Pdb):
     """Jac debugger."""
 
@@ -20,6 +20,7 @@ setup(
     package_data={
         "": ["*.ini", "*.lark"],
     },
+    options={"build_py": {"compile": True, "optimize": 0}},
     extras_require={"llms": ["transformers", "torch", "ollama", "anthropic", "groq"]},
     entry_points={
         "console_scripts": [